@@ -1,8 +1,20 @@
 import numpy as np
 from scipy.stats import norm
+from scipy.linalg import lu_factor, lu_solve
 import matplotlib.pyplot as plt
 from pylab import rcParams
 import io 
+from functools import lru_cache
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional, without it the jitted helpers run as plain Python and
+    # irf_lineal_cholesky uses _irf_recur_numpy instead of the scalar loops of _irf_recur
+    HAS_NUMBA = False
+    def njit(*args, **kwargs):
+        return args[0] if len(args) == 1 and callable(args[0]) else (lambda f: f)
 
 # Based on  https://github.com/MaxLugo/SVARIV/blob/master/SVARIV/__init__.py
 
@@ -19,6 +31,11 @@ def norm_critval(confidence=0.95, sq=False):
     rv = norm.ppf(1 - (1 - confidence) / 2) ** 2 if sq else norm.ppf(1 - (1 - confidence) / 2)
     return rv
 
+# Cached norm_critval for a scalar confidence, used by the CI functions
+@lru_cache(maxsize=32)
+def _norm_critval_cached(confidence, sq):
+    return norm_critval(confidence, sq)
+
 # Ordinary Least Squares regression function
 def ols(Y, X):
     '''
@@ -44,10 +61,12 @@ def NW_hac_STATA(Vars, lags):
         corrected sigma by lags
     '''
     Sigma0 = (Vars.T @ Vars) / len(Vars)
-    sigma_cov_k = lambda V, k: (V[0:-k].T @ V[0:-k]) / len(V)
-    S = Sigma0
-    for n in range(lags):
-        S += (1 - n / (lags + 1)) * sigma_cov_k(Vars, n) @ sigma_cov_k(Vars, n).T
+    # k-th autocovariance Gamma_k = Sum_t V_t V_t-k' / T
+    sigma_cov_k = lambda V, k: (V[k:].T @ V[:-k]) / len(V)
+    S = Sigma0.copy()
+    for k in range(1, lags + 1):
+        Gamma_k = sigma_cov_k(Vars, k)
+        S += (1 - k / (lags + 1)) * (Gamma_k + Gamma_k.T)
     return S
 
 # Function to compute the Wald test for a given endogenous variable in the context of OLS
@@ -63,49 +82,52 @@ def get_gamma_wald(X, Z, eta, p, n, nvar):
     output:
         WHat, wald, Gamma_hat
     '''
-    Gamma_hat = ((Z.T @ eta) / len(eta)).T
+    T_len, n_eta, K = eta.shape[0], eta.shape[1], X.shape[1]
+    Gamma_hat = ((Z.T @ eta) / T_len).T
     matagg = np.concatenate((X, eta, Z), axis=1).T
-    auxeta = np.zeros((len(eta.T), len(matagg), len(matagg.T)))
-    val = np.array([eta[i, np.newaxis].T @ matagg[:, i, np.newaxis].T for i in range(len(matagg.T))])
-    val_mean = val.mean(axis=0)
-    val_minus_mean = val - val_mean
-    for i in range(auxeta.shape[2]):
-        auxeta[:, :, i] = val_minus_mean[i, :, :]
-
-    AuxHAC2 = [auxeta[:, :, i].reshape(1, np.multiply(*auxeta[:, :, 0].shape), order='F')
-               for i in range(auxeta.shape[2])]
-    AuxHAC2 = np.concatenate(AuxHAC2, axis=0)
+    val = np.einsum('ti,tj->tij', eta, matagg.T)
+    val_minus_mean = val - val.mean(axis=0)
+    # row t is vec(eta_t matagg_t') - mean (column-major vec)
+    AuxHAC2 = val_minus_mean.transpose(0, 2, 1).reshape(T_len, -1)
     AuxHAC3 = NW_hac_STATA(AuxHAC2, 0)
 
-    I = np.eye(len(eta.T))
-    V = np.kron(I[0, :], I)
-    for i in range(1, len(eta.T)):
-        V = np.concatenate((V, np.kron(I[i, :], I[i:, :])), axis=0)
-
-    Q1 = X.T @ X / len(X)
-    Q2 = Z.T @ X / len(X)
-    m = X.shape[1] - (n * p)
-
-    Shat = np.zeros((len(Q1) * eta.shape[1] + len(V), len(Q1) * eta.shape[1] + len(V.T) + n))
-    A = np.kron(np.concatenate((np.zeros((n * p, m)), np.eye(n * p)), axis=1) @ np.linalg.inv(Q1),
-                np.eye(n))
-    Shat[0:A.shape[0], 0:A.shape[1]] = A
-    Shat[A.shape[0]:A.shape[0] + V.shape[0], A.shape[1]:A.shape[1] + V.shape[1]] = V
-    B = -np.kron(Q2 @ np.linalg.inv(Q1), np.eye(n))
-    Shat[-B.shape[0]:, 0:B.shape[1]] = B
-    C = np.eye(B.shape[0])
-    Shat[-C.shape[0]:, -C.shape[1]:] = C
+    # V selects the entries (i, j), j >= i, of vec(eta' eta)
+    i_idx, j_idx = np.triu_indices(n_eta)
+    n_V = len(i_idx)
+    V = np.zeros((n_V, n_eta ** 2))
+    V[np.arange(n_V), i_idx * n_eta + j_idx] = 1
+
+    Q1 = X.T @ X / T_len
+    Q2 = Z.T @ X / T_len
+    m = K - (n * p)
+
+    Shat = np.zeros((K * n_eta + n_V, K * n_eta + n_eta ** 2 + n))
+    # A = kron(M1, I_n) and B = -kron(M2, I_n) are written blockwise into Shat (no np.kron)
+    # M inv(Q1) = (Q1'^-1 M')' from a single LU factorization of Q1
+    Q1_lu = lu_factor(Q1)
+    if not np.all(np.diag(Q1_lu[0])):
+        raise np.linalg.LinAlgError('Singular matrix')
+    M1 = lu_solve(Q1_lu, np.concatenate((np.zeros((n * p, m)), np.eye(n * p)), axis=1).T, trans=1).T
+    M2 = lu_solve(Q1_lu, Q2.T, trans=1).T
+    A_shape = (M1.shape[0] * n, M1.shape[1] * n)
+    B_shape = (M2.shape[0] * n, M2.shape[1] * n)
+    for k in range(n):
+        Shat[k:A_shape[0]:n, k:A_shape[1]:n] = M1
+        Shat[Shat.shape[0] - B_shape[0] + k::n, k:B_shape[1]:n] = -M2
+    Shat[A_shape[0]:A_shape[0] + n_V, A_shape[1]:A_shape[1] + n_eta ** 2] = V
+    L_c = B_shape[0]
+    Shat[-L_c:, -L_c:] = np.eye(L_c)
     WHataux = Shat @ AuxHAC3 @ Shat.T
 
-    L = len(Q1) * len(C)
+    L = K * L_c
     WHat = np.zeros((L, L))
-    WHat[:-len(C), :-len(C)] = WHataux[:L - len(C), :L - len(C)]
-    WHat[-len(C):, -len(C):] = WHataux[-len(C):, -len(C):]
-    WHat[-len(C):, :L - len(C)] = WHataux[-len(C):, :L - len(C)]
-    WHat[:-len(C), L - len(C):] = WHat[-len(C):, :L - len(C)].T
+    WHat[:-L_c, :-L_c] = WHataux[:L - L_c, :L - L_c]
+    WHat[-L_c:, -L_c:] = WHataux[-L_c:, -L_c:]
+    WHat[-L_c:, :L - L_c] = WHataux[-L_c:, :L - L_c]
+    WHat[:-L_c, L - L_c:] = WHat[-L_c:, :L - L_c].T
 
-    place = -len(C) + nvar - 1
-    wald = (len(eta)) * Gamma_hat[nvar - 1, 0] ** 2 / WHat[place, place]
+    place = -L_c + nvar - 1
+    wald = T_len * Gamma_hat[nvar - 1, 0] ** 2 / WHat[place, place]
     return WHat, wald, Gamma_hat
 
 # Function to compute the impulse response function (IRF) using a linear Cholesky decomposition
@@ -116,6 +138,8 @@ def irf_lineal_cholesky(betas, S, periods=21, normalize=True, cumulative=True, k
                 with n rows = number of endog variables, in the paper betas=A
         S = covariance matrix (np.array)
             if S has shape nx1 it will assume that S = Gamma_hat
+            S must be square and symmetric with S[0, 0] > 0; only the first column of its
+            Cholesky factor is computed, so positive definiteness is not checked further
         normalize=True will normalize the shock to be 1 default=True
         cumulative=True will accumulate the irf response default=True
         periods = scalar with the number of periods to use in the irf default=21
@@ -124,27 +148,54 @@ def irf_lineal_cholesky(betas, S, periods=21, normalize=True, cumulative=True, k
         irf = matrix of irf (np.array) with all irf for all endog variables
     Notice the shock is always over the first variable. 
     '''
+    if periods < 1:
+        raise ValueError('periods must be at least 1')
     use_chol = True if S.shape[1] >= 2 else False
     Lags = int(betas.shape[1] / betas.shape[0]) 
     num_endog = int(betas.shape[0]) 
-    betas_lags = [betas[:, i * num_endog:(i + 1) * num_endog] for i in range(Lags)]
-    irf = np.zeros((periods, betas.shape[0]))
-    irf_0 = list(np.linalg.cholesky(S)[:, 0]) if use_chol == True else list(S)
+    betas_lags = np.ascontiguousarray(betas.reshape(num_endog, Lags, num_endog).transpose(1, 0, 2))
+    # first column of the lower Cholesky factor of S is S[:, 0] / sqrt(S[0, 0])
+    if use_chol and (S.shape[0] != S.shape[1] or not np.allclose(S, S.T)):
+        raise np.linalg.LinAlgError('Matrix is not square and symmetric')
+    if use_chol and not S[0, 0] > 0:
+        raise np.linalg.LinAlgError('Matrix is not positive definite')
+    irf_0 = S[:, 0] / np.sqrt(S[0, 0]) if use_chol == True else S[:, 0]
     if normalize:
-        irf_0 = koef * (np.array(irf_0) / (np.array(irf_0)[0]))
-    irf[0, :] = list(irf_0)
+        irf_0 = koef * (irf_0 / irf_0[0])
+    irf_recur = _irf_recur if HAS_NUMBA else _irf_recur_numpy
+    rv = irf_recur(betas_lags, np.asarray(irf_0, dtype=np.float64), periods, cumulative)
+    return rv
+
+# Recursion irf_t = Sum_k=1^min(t,p) A_k irf_t-k of irf_lineal_cholesky, accumulated on the fly
+# if cumulative. Only the last p responses are kept, in a ring buffer (irf_t-k in row (t-k) % p).
+@njit(cache=True)
+def _irf_recur(betas_lags, irf_0, periods, cumulative):
+    Lags, num_endog = betas_lags.shape[0], betas_lags.shape[1]
+    rv = np.empty((periods, num_endog))
+    irf = np.zeros((Lags, num_endog))
+    irf[0, :] = irf_0
+    rv[0, :] = irf_0
+    irf_t = np.empty(num_endog)
+    for t in range(1, periods):
+        irf_t[:] = 0.
+        for k in range(min(t, Lags)):
+            for i in range(num_endog):
+                for j in range(num_endog):
+                    irf_t[i] += betas_lags[k, i, j] * irf[(t - 1 - k) % Lags, j]
+        for i in range(num_endog):
+            irf[t % Lags, i] = irf_t[i]
+            rv[t, i] = rv[t - 1, i] + irf_t[i] if cumulative else irf_t[i]
+    return rv
+
+# Same recursion with one einsum per period, used when numba is not available
+def _irf_recur_numpy(betas_lags, irf_0, periods, cumulative):
+    Lags = betas_lags.shape[0]
+    irf = np.zeros((periods, len(irf_0)))
+    irf[0, :] = irf_0
     for t in range(1, periods):
-        B = betas_lags[:t]
-        i_lags = irf[0:t]
-        i_lags = i_lags[-len(B):, :]
-        i_lags_list = [i_lags[j, :].reshape(num_endog, 1) for j in range(i_lags.shape[0])]
-        i_lags_list.reverse()
-        agregg = [z[0] @ z[1] for z in zip(B, i_lags_list)]
-        sum_t = np.concatenate(agregg, axis=1).sum(axis=1)
-        irf[t, :] = sum_t
-    if cumulative:
-        irf_cum = irf.cumsum(axis=0)
-    rv = irf_cum if cumulative else irf
+        k = min(t, Lags)
+        irf[t, :] = np.einsum('kij,kj->i', betas_lags[:k], irf[t - k:t][::-1])
+    rv = irf.cumsum(axis=0) if cumulative else irf
     return rv
 
 # Function to compute the impulse response function (IRF) for a specific endogenous variable using the MA representation
@@ -163,7 +214,7 @@ def MA_representation(betas, p, hori=21):
         hori = number of forecast periods to be used in the MA representation 
                 in the paper is 20. In python, it is going to be 21 because it is not inclusive
     Output:
-        C = list of matrices (0 to k elements) with the MA representation 
+        C = array of shape (hori, n, n) with the MA matrices (0 to k elements) of the representation 
             in the sense of
             Y_t = Sum_k=0^inf C_k(A) * e_t-k
             where:
@@ -172,10 +223,12 @@ def MA_representation(betas, p, hori=21):
             For values m>p => A_m=0.
     '''
     n = len(betas)
-    A, C = [betas[:, n * i: n * (i + 1)] for i in range(p)], [np.eye(n)]
+    A = betas.reshape(n, p, n).transpose(1, 0, 2)
+    C = np.zeros((hori, n, n))
+    C[0] = np.eye(n)
     for m in range(1, hori):
-        C_m = np.array([a @ c for a, c in zip(A[:m], list(reversed(C)))]).sum(axis=0)
-        C.append(C_m)
+        k = min(m, p)
+        C[m] = np.einsum('kij,kjl->il', A[:k], C[m - k:m][::-1])
     return C
 
 # Function to compute G matrices for a given VAR model
@@ -195,27 +248,58 @@ def Gmatrices(betas, p, hori=21):
     '''
     n = len(betas)
     # create the MA representation
-    C = MA_representation(betas, p, hori)[1:]
-    C_aux = ([np.eye(n)] + C[:hori])[:hori-1]
+    C_aux = MA_representation(betas, p, hori)[:hori-1]
     J = np.concatenate([np.eye(n), np.zeros((n, (p - 1) * n))], axis=1)
     Alut = np.concatenate([betas, np.zeros((len(betas.T) - len(betas), len(betas.T)))], axis=0)
     Alut[len(betas):, :len(Alut.T) - len(betas)] = np.eye(len(Alut[len(betas):, :]))
-    AJ = [np.linalg.matrix_power(Alut, h) @ J.T for h in range(hori - 1)]
-    AJp = np.concatenate(AJ, axis=1).T
-    AJaux = []
-    for i in range(hori - 1):
-        l = np.kron(AJp[:n * (hori - i), :], C_aux[i])
-        Z = np.zeros((AJp.shape[0] * n, AJp.shape[1] * n))
-        Z[i * n**2:, :] = l[:len(Z) - n**2 * i, :]
-        AJaux.append(Z)
-    G0 = np.array(AJaux).sum(axis=0).T.reshape(p * n**2, n**2, hori - 1, order='F')
-    Gaux = np.moveaxis(G0, [0, 1, 2], [1, 0, 2])
-    G = np.zeros((Gaux.shape[0], Gaux.shape[1], Gaux.shape[2] + 1))
-    for i in range(1, Gaux.shape[2] + 1):
-        G[:, :, i] = Gaux[:, :, i - 1]
+    # Alut^h J' by a running product
+    AJ = np.empty((hori - 1, len(Alut), n))
+    AJ[0] = J.T
+    for h in range(1, hori - 1):
+        AJ[h] = Alut @ AJ[h - 1]
+    # G_h = Sum_i=0^h-1 kron((Alut^(h-1-i) J')', C_i),  AJs[h, i] = Alut^(h-i) J' for i <= h
+    lag = np.arange(hori - 1)[:, None] - np.arange(hori - 1)[None, :]
+    AJs = np.where((lag >= 0)[:, :, None, None], AJ[np.maximum(lag, 0)], 0)
+    Gaux = np.einsum('hiba,icd->acbdh', AJs, C_aux, optimize=True)
+    G = np.zeros((n**2, p * n**2, hori))
+    G[:, :, 1:] = Gaux.reshape(n**2, p * n**2, hori - 1)
     Gcum = np.cumsum(G, 2)
     return {'G': G, 'Gcum': Gcum}
 
+# Roots of ahat x^2 + bhat x + chat = 0 (the bounds of CI_dmethod) case by case
+@njit(cache=True, error_model='numpy')
+def _solve_bounds(ahat, bhat, Deltahat):
+    n, hori = ahat.shape
+    MSWlbound = np.empty((n, hori))
+    MSWubound = np.empty((n, hori))
+    casedummy = np.empty((n, hori))
+    for j in range(n):
+        for ih in range(hori):
+            a, b, D = ahat[j, ih], bhat[j, ih], Deltahat[j, ih]
+            # cases 1 and 2 share the roots -b/2a -+ sqrt(D)/|2a| (ordered for either sign of a)
+            inv2a = 0.5 / a if a != 0 else 0.
+            center = -b * inv2a
+            half = max(D, 0.) ** .5 * abs(inv2a)
+            roots = (D > 0) & (a != 0)
+            case3 = (a > 0) & (D < 0)
+            casedummy[j,ih] = (1. + (a < 0)) if roots else (3. if case3 else 4.)
+            MSWlbound[j,ih] = center - half if roots else (np.nan if case3 else -np.inf)
+            MSWubound[j,ih] = center + half if roots else (np.nan if case3 else np.inf)
+    return MSWlbound, MSWubound, casedummy
+
+# Function to compute kron(Gamma_hat', e_j') @ G[:, :, ih] for all endog variables and horizons
+def _kron_gamma_G(Gamma_hat, G, hori):
+    '''
+    Output:
+        KG = array (n, hori, G.shape[1]) with KG[j, ih] = kron(Gamma_hat', e_j') @ G[:, :, ih]
+    Notes: kron(Gamma_hat', e_j') picks the rows a*n + j of G weighted by Gamma_hat[a], so the
+           Gamma_hat contraction is done once for every (j, ih) pair.
+    '''
+    n = len(Gamma_hat)
+    G4 = G[:, :, :hori].reshape(n, n, G.shape[1], hori)
+    KG = np.tensordot(Gamma_hat[:, 0], G4, axes=(0, 0))
+    return np.ascontiguousarray(KG.transpose(0, 2, 1))
+
 # Function to compute confidence intervals using the Delta method
 def CI_dmethod(Gamma_hat, WHat, G, T, C, hori=21, confidence=0.95, scale=1, nvar=1):
     '''
@@ -228,7 +312,7 @@ def CI_dmethod(Gamma_hat, WHat, G, T, C, hori=21, confidence=0.95, scale=1, nvar
         G = Gradient matrix to be used, could be G or Gcum
         T = number of observations
         hori = 21 by default. Periods in the forecast. Same length as G.shape[1]
-        C = The Ma representation of A (betas_lag) in a list form 
+        C = The Ma representation of A (betas_lag), (hori, n, n) array or list of matrices 
         confidence = 0.95 by default. Is the confidence value to be used for the critical value
         scale = 1 by default which is the normalization to 1 in the first variable
         nvar = 1 by default which is the endog variable used as the normalization in Gamma_hat
@@ -243,58 +327,35 @@ def CI_dmethod(Gamma_hat, WHat, G, T, C, hori=21, confidence=0.95, scale=1, nvar
     n = len(Gamma_hat)
 
     # Calculate critical value
-    critval = norm.ppf(1-(1-confidence)/2)**2
+    critval = _norm_critval_cached(confidence, True)
 
     # Extract submatrices from WHat
     W1, W2 = WHat[:-n,:-n], WHat[-n:,-n:]
     W12 = WHat[W1.shape[0]:,:W1.shape[0]].T
 
-    # Identity matrix
-    e = np.eye(n)
-
-    # Initialize arrays for storing results
-    ahat = np.zeros((n, hori))
-    bhat = np.zeros((n, hori))
-    chat = np.zeros((n, hori))
-    Deltahat = np.zeros((n, hori))
-    MSWlbound = np.zeros((n, hori))
-    MSWubound = np.zeros((n, hori)) 
-    casedummy = np.zeros((n, hori))
-
-    # Loop through endogenous variables
-    for j in range(n):    
-        # Loop through forecast periods
-        for ih in range(hori):
-            # Calculate ahat, bhat, chat, and Deltahat
-            ahat[j,ih] = T*(Gamma_hat[nvar-1, 0]**2) - critval*W2[nvar-1, nvar-1] 
-            bhat[j, ih] = (-2*T*scale*(e[:,j].T @ C[ih] @ Gamma_hat @ Gamma_hat[nvar-1])
-                           + 2*critval*scale*np.kron(Gamma_hat.T, e[:,j].T) @ G[:,:,ih] @ W12[:, nvar-1]
-                           + 2*critval*scale*e[:,j].T @ C[ih] @ W2[:, nvar-1]
-                           )
-            chat[j, ih] = (((T**.5)*scale*e[:,j].T @ C[ih] @ Gamma_hat)**2
-                           -critval*(scale**2)*np.kron(Gamma_hat.T, e[:,j].T) @ G[:,:,ih] @ W1 @ (np.kron(Gamma_hat.T, e[:,j].T) @ G[:,:,ih]).T
-                           -2*critval*(scale**2)*np.kron(Gamma_hat.T, e[:,j].T) @ G[:,:,ih] @ W12 @ C[ih].T @ e[:,j]
-                           -critval*(scale**2)*e[:,j].T @ C[ih] @ W2 @ C[ih].T @ e[:,j]
-                          )
-            Deltahat[j,ih] = bhat[j,ih]**2 - (4*ahat[j,ih] * chat[j,ih])
-
-            # Check conditions and calculate bounds accordingly
-            if (ahat[j, ih]>0) and (Deltahat[j,ih]>0):            
-                casedummy[j,ih] = 1
-                MSWlbound[j,ih] = (-bhat[j,ih] - (Deltahat[j,ih]**.5))/(2*ahat[j,ih])
-                MSWubound[j,ih] = (-bhat[j,ih] + (Deltahat[j,ih]**.5))/(2*ahat[j,ih])
-            elif (ahat[j, ih]<0) and (Deltahat[j,ih]>0):
-                casedummy[j,ih] = 2
-                MSWlbound[j,ih] = (-bhat[j,ih] + (Deltahat[j,ih]**.5))/(2*ahat[j,ih])
-                MSWubound[j,ih] = (-bhat[j,ih] - (Deltahat[j,ih]**.5))/(2*ahat[j,ih])
-            elif (ahat[j, ih]>0) and (Deltahat[j,ih]<0):
-                casedummy[j,ih] = 3
-                MSWlbound[j,ih] = np.nan
-                MSWubound[j,ih] = np.nan
-            else:
-                casedummy[j,ih] = 4
-                MSWlbound[j,ih] = -np.inf
-                MSWubound[j,ih] = np.inf
+    # Stack the MA matrices of the forecast periods used into a (hori, n, n) array
+    Carr = np.asarray(C[:hori])
+    gamma, gamma_nvar = Gamma_hat[:, 0], Gamma_hat[nvar-1, 0]
+
+    # e_j' C_ih Gamma_hat and kron(Gamma_hat', e_j') G_ih for every (j, ih)
+    CG = np.einsum('hjk,k->jh', Carr, gamma)
+    KG = _kron_gamma_G(Gamma_hat, G, hori)
+
+    # Calculate ahat, bhat, chat, and Deltahat
+    ahat = np.full((n, hori), T*(gamma_nvar**2) - critval*W2[nvar-1, nvar-1])
+    bhat = (-2*T*scale*CG*gamma_nvar
+            + 2*critval*scale*KG @ W12[:, nvar-1]
+            + 2*critval*scale*(Carr @ W2[:, nvar-1]).T
+            )
+    chat = (((T**.5)*scale*CG)**2
+            -critval*(scale**2)*np.einsum('jhk,kl,jhl->jh', KG, W1, KG, optimize=True)
+            -2*critval*(scale**2)*np.einsum('jhk,kl,hjl->jh', KG, W12, Carr, optimize=True)
+            -critval*(scale**2)*np.einsum('hjk,kl,hjl->jh', Carr, W2, Carr, optimize=True)
+           )
+    Deltahat = bhat**2 - (4*ahat*chat)
+
+    # Check conditions and calculate bounds accordingly
+    MSWlbound, MSWubound, casedummy = _solve_bounds(ahat, bhat, Deltahat)
 
     # Set the bounds for the normalized variable
     MSWlbound[nvar-1, 0] = scale
@@ -317,7 +378,7 @@ def CI_dmethod_standard(Gamma_hat, WHat, G, T, C, hori=21, confidence=0.95, scal
         G = Gradient matrix to be used, could be G or Gcum
         T = number of observations
         hori = 21 by default. Periods in the forecast. Same length as G.shape[1]
-        C = The Ma representation of A (betas_lag) in a list form 
+        C = The Ma representation of A (betas_lag), (hori, n, n) array or list of matrices 
         confidence = 0.95 by default. Is the confidence value to be used for the critical value
         scale = 1 by default which is the normalization to 1 in the first variable
         nvar = 1 by default which is the endog variable used as the normalization in Gamma_hat
@@ -332,34 +393,26 @@ def CI_dmethod_standard(Gamma_hat, WHat, G, T, C, hori=21, confidence=0.95, scal
     n = len(Gamma_hat)
 
     # Calculate critical value
-    critval = norm.ppf(1-(1-confidence)/2)**2
+    critval = _norm_critval_cached(confidence, True)
 
     # Identity matrix
     e = np.eye(n)
 
-    # Initialize arrays for storing results
-    lambdahatcum = np.zeros((n, hori))
-    DmethodVarcum = np.zeros((n, hori))
-    Dmethodlboundcum = np.zeros((n, hori))
-    Dmethoduboundcum = np.zeros((n, hori))
-
-    # Loop through forecast periods
-    for ih in range(hori):    
-        # Loop through endogenous variables
-        for ivar in range(n):
-            # Calculate lambdahatcum
-            lambdahatcum[ivar,ih] = (scale*e[:,ivar].T @ C[ih] @ Gamma_hat / Gamma_hat[nvar-1,0])[0]        
-            
-            # Construct matrix d for D-method
-            d1 = scale * np.kron(Gamma_hat.T, e[:,ivar].T) @ G[:,:,ih]
-            d2 = scale * e[:,ivar].T @ C[ih] - lambdahatcum[ivar,ih] * e[:, nvar-1].T
-            d = np.concatenate([d1, d2.reshape(1,len(d2))], axis=1).T
-            
-            # Calculate D-method variance, lower and upper bounds
-            DmethodVarcum[ivar,ih] = d.T @ WHat @ d
-            Dmethodlboundcum[ivar,ih] = lambdahatcum[ivar,ih] - ((critval/T)**.5)*(DmethodVarcum[ivar,ih]**.5)/abs(Gamma_hat[nvar-1,0])
-            Dmethoduboundcum[ivar,ih] = lambdahatcum[ivar,ih] + ((critval/T)**.5)*(DmethodVarcum[ivar,ih]**.5)/abs(Gamma_hat[nvar-1,0])
-            del d
+    # Stack the MA matrices of the forecast periods used into a (hori, n, n) array
+    Carr = np.asarray(C[:hori])
+
+    # Calculate lambdahatcum
+    lambdahatcum = scale*np.einsum('hjk,k->jh', Carr, Gamma_hat[:, 0]) / Gamma_hat[nvar-1,0]
+
+    # Construct the d vectors of the D-method for every (ivar, ih)
+    d1 = scale * _kron_gamma_G(Gamma_hat, G, hori)
+    d2 = scale * Carr.transpose(1, 0, 2) - lambdahatcum[:, :, None] * e[nvar-1]
+    d = np.concatenate([d1, d2], axis=2)
+
+    # Calculate D-method variance, lower and upper bounds
+    DmethodVarcum = np.einsum('jhk,kl,jhl->jh', d, WHat, d, optimize=True)
+    Dmethodlboundcum = lambdahatcum - ((critval/T)**.5)*(DmethodVarcum**.5)/abs(Gamma_hat[nvar-1,0])
+    Dmethoduboundcum = lambdahatcum + ((critval/T)**.5)*(DmethodVarcum**.5)/abs(Gamma_hat[nvar-1,0])
 
     # Calculate standard error for pluginirf
     std = (DmethodVarcum**.5) / ((T**.5)*np.abs(Gamma_hat[nvar-1,0]))
@@ -0,0 +1 @@
+# Makes the repository root importable (import SVARIV) when running plain `pytest`
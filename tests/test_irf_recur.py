@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import SVARIV
+
+
+# Only one of the two IRF recursions is used at runtime (depending on numba),
+# so check here that they agree. Without numba _irf_recur runs as plain Python.
+@pytest.mark.parametrize('cumulative', [True, False])
+@pytest.mark.parametrize('n, p, periods', [(3, 2, 21), (6, 24, 21), (2, 5, 3), (4, 1, 1)])
+def test_irf_recur_paths_agree(n, p, periods, cumulative):
+    rng = np.random.default_rng(0)
+    betas_lags = rng.normal(size=(p, n, n)) * 0.2
+    irf_0 = rng.normal(size=n)
+    rv = SVARIV._irf_recur(betas_lags, irf_0, periods, cumulative)
+    rv_numpy = SVARIV._irf_recur_numpy(betas_lags, irf_0, periods, cumulative)
+    np.testing.assert_allclose(rv, rv_numpy, rtol=1e-12, atol=1e-14)
+
+
+# Independent reference: the IRF to the impact vector is the MA representation applied to it
+@pytest.mark.parametrize('n, p, periods', [(3, 2, 21), (5, 4, 10), (2, 1, 6)])
+def test_irf_lineal_cholesky_matches_ma_representation(n, p, periods):
+    rng = np.random.default_rng(1)
+    betas = rng.normal(size=(n, n * p)) * 0.2
+    aux = rng.normal(size=(4 * n, n))
+    S = aux.T @ aux
+    impact = np.linalg.cholesky(S)[:, 0]
+    irf = SVARIV.irf_lineal_cholesky(betas, S, periods=periods, normalize=False, cumulative=False)
+    np.testing.assert_allclose(irf, SVARIV.MA_representation(betas, p, periods) @ impact, rtol=1e-10, atol=1e-14)
+    irf_cum = SVARIV.irf_lineal_cholesky(betas, S, periods=periods, normalize=False, cumulative=True)
+    np.testing.assert_allclose(irf_cum, irf.cumsum(axis=0), rtol=1e-10, atol=1e-14)
+
+
+def test_irf_lineal_cholesky_var1_by_hand():
+    # VAR(1): irf_t = A^t irf_0, with irf_0 normalized to koef in the first variable
+    A = np.array([[0.5, 0.1], [0.2, 0.3]])
+    S = np.array([[4.0, 1.0], [1.0, 2.0]])
+    irf = SVARIV.irf_lineal_cholesky(A, S, periods=3, normalize=True, cumulative=False, koef=0.1)
+    irf_0 = np.array([0.1, 0.025])
+    expected = np.array([irf_0, A @ irf_0, A @ A @ irf_0])
+    np.testing.assert_allclose(irf, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('S', [np.ones((2, 3)), np.array([[2., 1.], [0., 2.]]), np.array([[0., 1.], [1., 2.]])])
+def test_irf_lineal_cholesky_rejects_bad_covariance(S):
+    with pytest.raises(np.linalg.LinAlgError):
+        SVARIV.irf_lineal_cholesky(np.eye(2) * 0.5, S)
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+import SVARIV
+
+
+@pytest.mark.parametrize('lags', [1, 2])
+def test_nw_hac_matches_explicit_bartlett_sum(lags):
+    V = np.random.default_rng(0).normal(size=(50, 3))
+    T = len(V)
+    expected = sum(np.outer(V[t], V[t]) for t in range(T)) / T
+    for k in range(1, lags + 1):
+        Gamma_k = sum(np.outer(V[t], V[t - k]) for t in range(k, T)) / T
+        expected += (1 - k / (lags + 1)) * (Gamma_k + Gamma_k.T)
+    np.testing.assert_allclose(SVARIV.NW_hac_STATA(V, lags), expected, rtol=1e-12)
+
+
+def test_nw_hac_no_lags_is_second_moment_and_keeps_input():
+    V = np.random.default_rng(1).normal(size=(40, 4))
+    V_copy = V.copy()
+    np.testing.assert_allclose(SVARIV.NW_hac_STATA(V, 0), V.T @ V / len(V), rtol=1e-12)
+    np.testing.assert_array_equal(V, V_copy)
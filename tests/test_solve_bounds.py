@@ -0,0 +1,31 @@
+import warnings
+
+import numpy as np
+
+import SVARIV
+
+
+# Bounds of the quadratic ahat x^2 + bhat x + chat by the original if/elif rules of CI_dmethod
+def bounds_by_cases(a, b, D):
+    if (a > 0) and (D > 0):
+        return (-b - D**.5) / (2 * a), (-b + D**.5) / (2 * a), 1
+    elif (a < 0) and (D > 0):
+        return (-b + D**.5) / (2 * a), (-b - D**.5) / (2 * a), 2
+    elif (a > 0) and (D < 0):
+        return np.nan, np.nan, 3
+    else:
+        return -np.inf, np.inf, 4
+
+
+def test_solve_bounds_matches_case_rules():
+    # a>0/D>0, a<0/D>0, a>0/D<0, a<0/D<0, a=0/D>0, a=0/D<0, a>0/D=0, a<0/D=0
+    ahat = np.array([[1., -1., 1., -1., 0., 0., 2., -2.]])
+    bhat = np.array([[1., 2., 3., -1., 1., 1., 5., 5.]])
+    Deltahat = np.array([[4., 9., -1., -2., 1., -1., 0., 0.]])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        l, u, casedummy = SVARIV._solve_bounds(ahat, bhat, Deltahat)
+    expected = [bounds_by_cases(a, b, D) for a, b, D in zip(ahat[0], bhat[0], Deltahat[0])]
+    np.testing.assert_allclose(l[0], [e[0] for e in expected])
+    np.testing.assert_allclose(u[0], [e[1] for e in expected])
+    np.testing.assert_array_equal(casedummy[0], [e[2] for e in expected])